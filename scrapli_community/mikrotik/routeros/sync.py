@@ -92,7 +92,8 @@ class MikrotikRouterOSDriver(GenericDriver):
 
         # Since the command is echoed twice, and scrapli only removes it once, we need to
         # manually remove the second command echo by stripping the first line from the output.
-        if response.result.count("\n") > 0 and command in response.result.split("\n")[0]:
-            response.result = "\n".join(response.result.split("\n")[1:])
+        first_line, newline, remainder = response.result.partition("\n")
+        if newline and command in first_line:
+            response.result = remainder
 
         return response